@@ -2,6 +2,8 @@
 Mapping of group names to participant counts
 Keys must exactly match the folder/base names of the JSON exports
 """
+from types import MappingProxyType
+
 group_sizes = {
     'aquarium fighters': 313,
     'BC club': 60,
@@ -37,6 +39,11 @@ EMOJI_CATEGORIES = {
         'fun': ['💃', '🧚‍♂️']
     }
 
+# Reverse lookup: emoji -> category name (read-only)
+EMOJI_TO_CATEGORY = MappingProxyType(
+    {emoji: category for category, emojis in EMOJI_CATEGORIES.items() for emoji in emojis}
+)
+
 
 export_direction = './exports'
 output_direction = './output'
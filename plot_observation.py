@@ -6,8 +6,9 @@ then produces three different plots:
 """
 
 import os
-import glob
+import re
 import json
+import numpy as np
 import pandas as pd
 import matplotlib
 
@@ -18,63 +19,177 @@ import matplotlib.pyplot as plt
 import matplotlib.ticker as mtick
 from graph_config import group_sizes
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow  # noqa: F401  (only needed as a read_csv engine)
+    _CSV_ENGINE = 'pyarrow'
+except ImportError:
+    _CSV_ENGINE = 'c'
+
+# The only analysis columns the plots read
+_COUNT_COLUMNS = ['AnswerCount', 'ReplyCount', 'EmojiCount']
+
+
+def _load_json(path):
+    """Parse a JSON export, using orjson when it is installed."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _tally(messages):
+    """Count messages, replies and emoji reactions in a single pass over the messages."""
+    total = 0
+    replies = 0
+    reactions = 0
+    for m in messages:
+        if not isinstance(m, dict):  # stray non-message entries in some exports
+            continue
+        total += 1
+        if m.get('replyTo') is not None:
+            replies += 1
+        for r in m.get('reactions') or ():
+            reactions += r.get('count', 0)
+    return total, replies, reactions
+
+
+def _num_answered(df):
+    """Number of questions that got any answer, reply or emoji."""
+    # blank cells read as NaN; treat them as zero rather than casting NaN to int
+    counts = df[_COUNT_COLUMNS].fillna(0).to_numpy(dtype=np.int64)
+    return int(np.count_nonzero(counts.sum(axis=1)))
+
+
+_HEBREW_RE = re.compile(r'[\u0590-\u05FF]')
+
 
 def _fix_rtl(s):
     """Reverse Hebrew strings for correct display."""
-    return s[::-1] if any('\u0590' <= c <= '\u05FF' for c in s) else s
+    return s[::-1] if _HEBREW_RE.search(s) else s
 
 
 # Define folders
 export_dir = graph_config.export_direction
 output_dir = graph_config.output_direction
-stats = []
 
+# Keyed by file path: (messages, replies, reactions) counts for JSON exports,
+# analysis DataFrames for analysij CSVs
+_cache = {}
+
+
+def _load_group(json_path):
+    """
+    Return (messages, replies, reactions) counts for one JSON export,
+    parsing it only once. Only the counts are kept, so each parsed export
+    can be freed as soon as it has been tallied.
+    """
+    if json_path not in _cache:
+        data = _load_json(json_path)
+        msgs = data.get('messages', []) if isinstance(data, dict) else data
+        _cache[json_path] = _tally(msgs)
+    return _cache[json_path]
+
+
+def _load_analysis(csv_path):
+    """Return the question-level analysis CSV as a DataFrame, reading it only once."""
+    if csv_path not in _cache:
+        _cache[csv_path] = pd.read_csv(csv_path, encoding='utf-8-sig',
+                                       engine=_CSV_ENGINE, usecols=_COUNT_COLUMNS)
+    return _cache[csv_path]
+
+
+def _iter_json(directory):
+    """Paths of the JSON files directly inside a directory, skipping dotfiles as glob did."""
+    return [e.path for e in os.scandir(directory)
+            if e.is_file() and e.name.endswith('.json') and not e.name.startswith('.')]
+
+
+# Greedy on purpose: group names may themselves contain '_' (e.g. BC_who_run_when)
+_ANALYSIJ_RE = re.compile(r'^analysij_(?P<base>.+)\.csv$')
+
+
+def _index_analyses(directory):
+    """Map each analysij_<base>.csv in a directory to its group base name."""
+    csv_index = {}
+    for e in os.scandir(directory):
+        m = _ANALYSIJ_RE.match(e.name)
+        if m and e.is_file():
+            csv_index[m.group('base')] = e.path
+    return csv_index
+
+
+def _find_analysis_csv(base, csv_index):
+    """Locate the analysij CSV written for a group, or None if it is missing."""
+    expected = csv_index.get(base)
+    if expected is None:
+        # fall back to a CSV whose name merely starts with the group name
+        expected = next((path for stem, path in csv_index.items() if stem.startswith(base)), None)
+    return expected
+
+
+def load_all_exports():
+    """
+    Load every JSON export and its question analysis once.
+
+    Returns two dicts keyed by group name: the (messages, replies, reactions)
+    counts of each export, and the analysis DataFrame of each group that has
+    a CSV.
+    """
+    counts_by_group = {}
+    questions_by_group = {}
+
+    # index the output folder once instead of searching it per group
+    csv_index = _index_analyses(output_dir)
 
-def plot1():
-    # Scan each JSON file
-    for json_path in glob.glob(os.path.join(export_dir, '*.json')):
+    for json_path in _iter_json(export_dir):
         base = os.path.splitext(os.path.basename(json_path))[0]
+        counts_by_group[base] = _load_group(json_path)
 
-        expected = os.path.join(output_dir, f'analysij_{base}.csv')
-        if not os.path.isfile(expected):
-            matches = glob.glob(os.path.join(output_dir, f'analysij_{base}*.csv'))
-            if not matches:
-                print(f" CSV not found for '{base}', skipping.")
-                continue
-            expected = matches[0]
-
-        # Load message data
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        messages = data['messages'] if isinstance(data, dict) else data
-
-        total_messages = len(messages)
-        total_emojis = sum(
-            sum(r.get('count', 0) for r in (msg.get('reactions') or []))
-            for msg in messages
-        )
+        expected = _find_analysis_csv(base, csv_index)
+        if expected is None:
+            print(f" CSV not found for '{base}', skipping.")
+            continue
+        questions_by_group[base] = _load_analysis(expected)
+
+    return counts_by_group, questions_by_group
+
+
+def plot1(counts_by_group, questions_by_group, ax):
+    group_names     = []
+    answered_pcts   = []
+    unanswered_pcts = []
+    other_pcts      = []
+
+    # Scan each analysed group
+    for base, df in questions_by_group.items():
+        total_messages, _, total_emojis = counts_by_group[base]
         total_with_emojis = total_messages + total_emojis
 
-        # Load CSV analysis
-        df = pd.read_csv(expected, encoding='utf-8-sig')
+        # Question-level analysis
         total_questions = len(df)
-        answered_mask = (df['AnswerCount'] + df['ReplyCount'] + df['EmojiCount']) > 0
-        num_answered = answered_mask.sum()
+        num_answered = _num_answered(df)
 
         # Calculate percentages
         answered_pct = num_answered / total_with_emojis
         unanswered_pct = (total_questions - num_answered) / total_with_emojis
         other_pct = 1.0 - (answered_pct + unanswered_pct)
 
-        stats.append({
-            'group': base,
-            'Answered Questions': answered_pct,
-            'Unanswered Questions': unanswered_pct,
-            'Other Messages': other_pct
-        })
+        group_names.append(base)
+        answered_pcts.append(answered_pct)
+        unanswered_pcts.append(unanswered_pct)
+        other_pcts.append(other_pct)
 
     # Create DataFrame
-    df = pd.DataFrame(stats)
+    df = pd.DataFrame({
+        'group':                group_names,
+        'Answered Questions':   answered_pcts,
+        'Unanswered Questions': unanswered_pcts,
+        'Other Messages':       other_pcts
+    })
 
     # Add participant counts to labels
     df['Participants'] = df['group'].map(group_sizes)
@@ -92,7 +207,7 @@ def plot1():
     he_labels = [_fix_rtl('שאלות שקיבלו תגובה'), _fix_rtl('שאלות שלא קיבלו תגובה'), _fix_rtl('הודעות שאינן שאלות')]
 
     # Plot the chart
-    ax = df.plot(kind='bar', stacked=True, figsize=(15, 10), color=colors)
+    df.plot(kind='bar', stacked=True, color=colors, ax=ax)
 
     # Set Hebrew labels
     ax.set_title(_fix_rtl('פילוח הודעות בקבוצות: שאלות, תגובות, אחרות'))
@@ -101,7 +216,7 @@ def plot1():
     ax.yaxis.set_major_formatter(mtick.PercentFormatter(1.0))
 
     # Legend outside the chart
-    plt.legend(
+    ax.legend(
         he_labels,
         title=_fix_rtl('סוג הודעה'),
         loc='upper left',
@@ -110,22 +225,16 @@ def plot1():
     )
 
     # Add percentage labels to each bar segment
-    for i, group in enumerate(df.index):
-        y_offset = 0
-        for j, col in enumerate(df.columns):
-            height = df.iloc[i, j]
-            if height > 0.0049:
-                ax.text(i, y_offset + height / 2, f"{height * 100:.1f}%",
-                        ha='center', va='center', fontsize=5, color='black')
-            y_offset += height
+    for container in ax.containers:
+        ax.bar_label(container,
+                     labels=[f"{h * 100:.1f}%" if h > 0.0049 else '' for h in container.datavalues],
+                     label_type='center', fontsize=5, color='black')
 
     # Adjust layout
-    plt.xticks(rotation=45, ha='right', fontsize=6)
-    plt.tight_layout(rect=[0, 0, 0.85, 1])
-    plt.show()
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right', fontsize=6)
 
 
-def plot2():
+def plot2(counts_by_group, ax):
     """
     100% stacked‑bar with Replies (green) at bottom, Emojis (yellow) in middle,
     and Plain Messages (skyblue) on top, with bars ordered by group size,
@@ -137,18 +246,7 @@ def plot2():
     replies     = []
 
     # collect raw counts per group
-    for json_path in glob.glob(os.path.join(export_dir, '*.json')):
-        base = os.path.splitext(os.path.basename(json_path))[0]
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        msgs = data.get('messages', []) if isinstance(data, dict) else data
-
-        total       = len(msgs)
-        total_repls = sum(1 for m in msgs if m.get('replyTo') is not None)
-        total_emj   = sum(
-            sum(r.get('count', 0) for r in (m.get('reactions') or []))
-            for m in msgs
-        )
+    for base, (total, total_repls, total_emj) in counts_by_group.items():
         total_plain = total - total_repls
 
         group_names.append(base)
@@ -180,28 +278,25 @@ def plot2():
     df_pct = df_pct[['Replies', 'Emojis', 'No-Reply/Emoji Messages']]
 
     # plot 100% stacked bar chart
-    ax = df_pct.plot(
+    df_pct.plot(
         kind='bar',
         stacked=True,
         color=['green', 'yellow', 'skyblue'],
-        figsize=(18, 9)
+        ax=ax
     )
     ax.set_title('Group Response Activity by Message and Response Type')
     ax.set_xlabel('WhatsApp Group')
     ax.set_ylabel('Percentage of Total')
     ax.yaxis.set_major_formatter(mtick.PercentFormatter(1.0))
-    plt.xticks(rotation=45, ha='right', fontsize=8)
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right', fontsize=8)
 
     # annotate each segment with its percentage
-    for i, row in enumerate(df_pct.itertuples()):
-        y = 0.0
-        for val in row[1:]:
-            if val >= 0.0005:
-                ax.text(
-                    i, y + val/2, f"{val*100:.1f}%",
-                    ha='center', va='center', fontsize=5, color='black'
-                )
-            y += val
+    for container in ax.containers:
+        ax.bar_label(
+            container,
+            labels=[f"{val*100:.1f}%" if val >= 0.0005 else '' for val in container.datavalues],
+            label_type='center', fontsize=5, color='black'
+        )
 
     # raw counts override for specific groups
     override = {
@@ -229,48 +324,33 @@ def plot2():
         borderaxespad=0
     )
 
-    plt.tight_layout(rect=[0, 0, 0.85, 1])
-    plt.show()
 
-
-def plot3():
+def plot3(questions_by_group, ax):
     """
     100% stacked-bar chart showing, for each group, the percentage of
     questions that got answered vs. those that did not.
     """
-    stats3 = []
+    group_names = []
+    answered    = []
+    unanswered  = []
 
     # gather per-group answered/unanswered counts
-    for json_path in glob.glob(os.path.join(export_dir, '*.json')):
-        base = os.path.splitext(os.path.basename(json_path))[0]
-
-        # find corresponding CSV
-        expected = os.path.join(output_dir, f'analysij_{base}.csv')
-        if not os.path.isfile(expected):
-            matches = glob.glob(os.path.join(output_dir, f'analysij_{base}*.csv'))
-            if not matches:
-                print(f" CSV not found for '{base}', skipping.")
-                continue
-            expected = matches[0]
-
-        # load question-level analysis
-        df_q = pd.read_csv(expected, encoding='utf-8-sig')
+    for base, df_q in questions_by_group.items():
         total_q = len(df_q)
         # answered = any reply, comment or emoji
-        is_answered = (df_q['AnswerCount']
-                       + df_q['ReplyCount']
-                       + df_q['EmojiCount']) > 0
-        num_ans = is_answered.sum()
+        num_ans = _num_answered(df_q)
         num_unans = total_q - num_ans
 
-        stats3.append({
-            'group': base,
-            'Answered': num_ans / total_q if total_q else 0,
-            'Unanswered': num_unans / total_q if total_q else 0
-        })
+        group_names.append(base)
+        answered.append(num_ans / total_q if total_q else 0)
+        unanswered.append(num_unans / total_q if total_q else 0)
 
     # build DataFrame
-    df3 = pd.DataFrame(stats3)
+    df3 = pd.DataFrame({
+        'group':      group_names,
+        'Answered':   answered,
+        'Unanswered': unanswered
+    })
     df3['Participants'] = df3['group'].map(group_sizes)
     df3['label'] = df3['group'] + ' (' + df3['Participants'].fillna('?').astype(str) + ')'
     df3 = df3.sort_values('Participants', ascending=False).set_index('label')
@@ -281,28 +361,27 @@ def plot3():
     # colors: answered in green, unanswered in gold
     colors = ['green', 'gold']
 
-    ax = df3.plot(
+    df3.plot(
         kind='bar',
         stacked=True,
-        figsize=(15, 8),
-        color=colors
+        color=colors,
+        ax=ax
     )
 
     # formatting
     ax.set_title(_fix_rtl('שאלות שקיבלו מענה לעומת שלא קיבלו'))
     ax.set_ylabel(_fix_rtl('אחוזים מכלל השאלות'))
     ax.yaxis.set_major_formatter(mtick.PercentFormatter(1.0))
-    plt.xticks(rotation=45, ha='right', fontsize=6)
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right', fontsize=6)
 
     # annotate each segment
-    for i, (ans, unans) in enumerate(zip(df3['Answered'], df3['Unanswered'])):
-        if ans > 0.01:
-            ax.text(i, ans/2, f"{ans*100:.1f}%", ha='center', va='center', fontsize=5)
-        if unans > 0.01:
-            ax.text(i, ans + unans/2, f"{unans*100:.1f}%", ha='center', va='center', fontsize=5)
+    for container in ax.containers:
+        ax.bar_label(container,
+                     labels=[f"{v*100:.1f}%" if v > 0.01 else '' for v in container.datavalues],
+                     label_type='center', fontsize=5)
 
     # legend outside
-    plt.legend(
+    ax.legend(
         [_fix_rtl('קיבלו מענה'), _fix_rtl('לא קיבלו מענה')],
         title=_fix_rtl('סטטוס שאלה'),
         loc='upper left',
@@ -310,12 +389,16 @@ def plot3():
         borderaxespad=0
     )
 
-    plt.tight_layout(rect=[0, 0, 0.85, 1])
-    plt.show()
 
+if __name__ == '__main__':
+    counts_by_group, questions_by_group = load_all_exports()
 
+    # draw all three charts on one figure and show it once
+    plt.ioff()
+    fig, axes = plt.subplots(3, 1, figsize=(18, 27))
+    plot1(counts_by_group, questions_by_group, axes[0])
+    plot2(counts_by_group, axes[1])
+    plot3(questions_by_group, axes[2])
 
-if __name__ == '__main__':
-    plot1()
-    plot2()
-    plot3()
+    fig.tight_layout(rect=[0, 0, 0.85, 1])
+    plt.show()